@@ -1,20 +1,35 @@
-from groq import Groq
+from groq import Groq, RateLimitError
+import logging
 import os
-from config import MODEL_NAME, TEMPERATURE
+import time
+from config import MODEL_NAME, TEMPERATURE, RATE_LIMIT_RETRIES, BACKOFF_SECONDS
+
+logger = logging.getLogger(__name__)
 
 client = Groq(api_key=os.getenv("GROQ_API_KEY"))
 
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a clinical data extraction engine. Return valid JSON only."
+}
+
 def call_llm(prompt):
-    try:
-        response = client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[
-                {"role": "system", "content": "You are a clinical data extraction engine. Return valid JSON only."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=TEMPERATURE
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        print("API Error:", e)
-        return None
\ No newline at end of file
+    for attempt in range(RATE_LIMIT_RETRIES):
+        try:
+            response = client.chat.completions.create(
+                model=MODEL_NAME,
+                messages=[
+                    SYSTEM_MESSAGE,
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=TEMPERATURE
+            )
+            return response.choices[0].message.content
+        except RateLimitError as e:
+            logger.warning("Groq rate limit hit (attempt %d): %s", attempt + 1, e)
+            if attempt + 1 < RATE_LIMIT_RETRIES:
+                time.sleep(BACKOFF_SECONDS * 2 ** attempt)
+        except Exception as e:
+            logger.warning("Groq API error: %s", e)
+            return None
+    return None
@@ -1,3 +1,5 @@
 MODEL_NAME = "llama-3.1-8b-instant"
 TEMPERATURE = 0.2
-RETRIES = 2
\ No newline at end of file
+RETRIES = 2
+RATE_LIMIT_RETRIES = 3
+BACKOFF_SECONDS = 0.5
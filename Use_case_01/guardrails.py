@@ -1,11 +1,18 @@
+import re
+
 BLOCKED_PHRASES = [
     "diagnosis",
     "you have",
     "this indicates"
 ]
 
+BLOCKED_PATTERN = re.compile(
+    "|".join(re.escape(phrase) for phrase in BLOCKED_PHRASES),
+    re.IGNORECASE
+)
+
 def check_scope_violation(output_text):
-    for phrase in BLOCKED_PHRASES:
-        if phrase.lower() in output_text.lower():
-            return False, f"Blocked phrase detected: {phrase}"
-    return True, "Safe"
\ No newline at end of file
+    match = BLOCKED_PATTERN.search(output_text)
+    if match:
+        return False, f"Blocked phrase detected: {match.group(0).lower()}"
+    return True, "Safe"
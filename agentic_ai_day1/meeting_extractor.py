@@ -1,6 +1,8 @@
 import json
 from ai_utils import call_ai
 
+ACTION_ITEM_FIELDS = ["task", "owner", "deadline"]
+
 def extract_meeting_data(text):
 
     prompt = f"""
@@ -36,7 +38,7 @@ def validate_meeting(data):
         return "❌ Missing action_items"
 
     for item in data["action_items"]:
-        if not all(key in item for key in ["task", "owner", "deadline"]):
+        if not all(key in item for key in ACTION_ITEM_FIELDS):
             return "❌ Invalid action item structure"
 
     return data
@@ -2,6 +2,14 @@ import json
 from urllib import response
 from ai_utils import call_ai
 
+REQUIRED_FIELDS = [
+    "candidate_name",
+    "skills",
+    "years_experience",
+    "suggested_role",
+    "suitability_score"
+]
+
 def screen_resume(resume_text):
 
     prompt = f"""
@@ -34,27 +42,19 @@ def screen_resume(resume_text):
 
 
 def validate_resume(data):
-    
-    required_fields = [
-        "candidate_name",
-        "skills",
-        "years_experience",
-        "suggested_role",
-        "suitability_score"
-    ]
-
-    for field in required_fields:
+
+    for field in REQUIRED_FIELDS:
         if field not in data:
             return f"X Missing field: {field}" 
-        
-        if not isinstance(data["skills"], list):
-            return "X skills must be list."
-        
-        if not isinstance(data["years_experience"], (int, float)):
-            return "X years_experience should be a number."
-        
-        if not (0 <= data["suitability_score"] <= 10):
-            return "❌ Score must be between 0 and 10"
+
+    if not isinstance(data["skills"], list):
+        return "X skills must be list."
+
+    if not isinstance(data["years_experience"], (int, float)):
+        return "X years_experience should be a number."
+
+    if not (0 <= data["suitability_score"] <= 10):
+        return "❌ Score must be between 0 and 10"
 
     return data
 
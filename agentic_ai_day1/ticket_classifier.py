@@ -1,6 +1,9 @@
 import json
 from ai_utils import call_ai
 
+ALLOWED_CATEGORIES = frozenset(["Billing", "Technical", "Account", "Other"])
+ALLOWED_URGENCY = frozenset(["Low", "Medium", "High"])
+
 def classify_ticket(ticket_text):
 
     prompt = f"""
@@ -32,13 +35,10 @@ def classify_ticket(ticket_text):
 
 def validate_ticket(data):
 
-    allowed_categories = ["Billing", "Technical", "Account", "Other"]
-    allowed_urgency = ["Low", "Medium", "High"]
-
-    if data["category"] not in allowed_categories:
+    if data["category"] not in ALLOWED_CATEGORIES:
         return "❌ Invalid category"
 
-    if data["urgency"] not in allowed_urgency:
+    if data["urgency"] not in ALLOWED_URGENCY:
         return "❌ Invalid urgency level"
 
     return data